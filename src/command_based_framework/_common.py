@@ -27,6 +27,8 @@ class ContextManagerMixin(object):
     raises an error. Use this method to process the exception.
     """  # noqa: E501
 
+    __slots__ = ()
+
     def __enter__(self) -> "ContextManagerMixin":
         """Called when the command enters a context manager."""
         return self
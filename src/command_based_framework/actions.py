@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import Hashable, Optional
 
 # fmt: off
 from command_based_framework._common import CallableCommandType, CommandType, ContextManagerMixin
@@ -9,7 +10,7 @@ from command_based_framework.scheduler import Scheduler
 # fmt: on
 
 
-class Condition(Enum):
+class Condition(IntEnum):
     """Enums representing different action conditions."""
 
     cancel_when_activated = auto()
@@ -34,6 +35,8 @@ class Action(ContextManagerMixin):  # noqa: WPS214
     A command can be bound to a single or multiple actions.
     """  # noqa: E501
 
+    __slots__ = ("__weakref__", "_last_state")
+
     # Flag to indicate the state of the action the last time it was
     # checked
     _last_state: bool
@@ -75,6 +78,29 @@ class Action(ContextManagerMixin):  # noqa: WPS214
             Condition.cancel_when_activated,
         )
 
+    def notify(self) -> None:
+        """Poll this action on the next frame.
+
+        Call this from whatever drives the action's state, such as an
+        input callback, so the change is picked up even between full
+        polls. See
+        :attr:`~command_based_framework.scheduler.Scheduler.full_poll_interval`.
+        """  # noqa: E501
+        Scheduler.get_instance().notify(self)  # type: ignore
+
+    def state_key(self) -> Optional[Hashable]:
+        """Summarize the inputs :meth:`~Action.poll` depends on.
+
+        The scheduler reuses the last result of :meth:`~Action.poll`
+        instead of calling it again for as long as this key is
+        unchanged. Notifying the scheduler of this action always results
+        in a fresh poll.
+
+        Returns:
+            A hashable snapshot of the inputs to :meth:`~Action.poll`, or
+            `None`, the default, to poll every time.
+        """
+
     def toggle_when_activated(self, command: Command) -> None:
         """Toggle scheduling `command` when this action is activated.
 
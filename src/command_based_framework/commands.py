@@ -53,6 +53,15 @@ class Command(ContextManagerMixin):  # noqa: WPS214
     long as the command is scheduled, but releases it immediately after.
     """  # noqa: E501
 
+    __slots__ = (
+        "__weakref__",
+        "_name",
+        "_requirements",
+        "_requirements_mask",
+        "_needs_interrupt",
+        "_state",
+    )
+
     # The name of the command
     _name: str
 
@@ -61,6 +70,10 @@ class Command(ContextManagerMixin):  # noqa: WPS214
     # subsystem at any time
     _requirements: Set[Subsystem]
 
+    # Combined masks of all requirements, allowing shared requirements
+    # to be detected with a single bitwise and
+    _requirements_mask: int
+
     # Indicates whether or not the command needs to be interrupted after
     # encountering an error
     _needs_interrupt: bool
@@ -80,6 +93,7 @@ class Command(ContextManagerMixin):  # noqa: WPS214
         super().__init__()
         self._name = name or self.__class__.__name__
         self._requirements = set()
+        self._requirements_mask = 0
         self._needs_interrupt = False
         self._state = CommandState.idle
 
@@ -145,6 +159,17 @@ class Command(ContextManagerMixin):  # noqa: WPS214
         """
         return self._requirements
 
+    @property
+    def requirements_mask(self) -> int:
+        """The combined :attr:`~command_based_framework.subsystems.Subsystem.mask` of all requirements.
+
+        This is a read-only property.
+
+        Two commands share requirements if the bitwise and of their
+        masks is not `0`.
+        """  # noqa: E501
+        return self._requirements_mask
+
     @property
     def state(self) -> CommandState:
         """The state of the command.
@@ -166,7 +191,9 @@ class Command(ContextManagerMixin):  # noqa: WPS214
         scheduled then it will be interrupted by the newly scheduled
         command.
         """
-        self._requirements.update(set(subsystems))
+        self._requirements.update(subsystems)
+        for subsystem in subsystems:
+            self._requirements_mask |= subsystem.mask
 
     def initialize(self) -> None:
         """Called each time the command in scheduled.
@@ -206,6 +233,8 @@ class Command(ContextManagerMixin):  # noqa: WPS214
 class WaitCommand(Command):
     """A command that waits for a specified period of time."""
 
+    __slots__ = ("_delay", "_start")
+
     _delay: float
     _start: float
 
@@ -247,6 +276,8 @@ class CommandGroup(Command):
     Any command or group can be provided to this abstract.
     """
 
+    __slots__ = ("_commands",)
+
     _commands: Tuple[CommandType, ...]
 
     def __init__(self, name: Optional[str] = None, *commands: CommandType) -> None:
@@ -276,6 +307,8 @@ class SequentialCommandGroup(CommandGroup):
     Any command or group can be provided to the constructor.
     """
 
+    __slots__ = ("_sequence", "_current_command", "_end_of_sequence")
+
     _sequence: Iterator[CommandType]
     _current_command: Optional[CommandType]
     _end_of_sequence: bool
@@ -348,6 +381,8 @@ class ParallelCommandGroup(CommandGroup):
     requirements.
     """
 
+    __slots__ = ("_pool", "_finished", "_sentinel")
+
     _pool: ThreadPoolExecutor
     _finished: Barrier
     _sentinel: Event
@@ -375,9 +410,9 @@ class ParallelCommandGroup(CommandGroup):
         # Check for shared requirements
         for command in commands:
             for cmd in commands:
-                if cmd == command:
+                if cmd is command:
                     continue
-                if cmd.requirements.intersection(command.requirements):
+                if cmd.requirements_mask & command.requirements_mask:
                     raise ValueError(
                         "{cmd1} has shared requirements with {cmd2}".format(
                             cmd1=command,
@@ -424,6 +459,9 @@ class ParallelCommandGroup(CommandGroup):
         sentinel: Event,
     ) -> None:
         try:  # noqa: WPS229
+            # Resolve the scheduler once rather than every iteration
+            scheduler = Scheduler.get_instance()
+
             # Initialize the command
             command.initialize()
 
@@ -442,7 +480,7 @@ class ParallelCommandGroup(CommandGroup):
                 # Execute the current command
                 command.execute()
 
-                time.sleep(Scheduler.get_instance().clock_speed)  # type: ignore
+                time.sleep(scheduler.clock_speed)  # type: ignore
         except Exception:
             # Handle errors
             command.handle_exception(*sys.exc_info())
@@ -1,11 +1,13 @@
+import itertools
 import sys
 import time
 import warnings
 import weakref
-from concurrent.futures import Future
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
-from threading import Event, Thread
-from typing import Dict, Optional, Set, Type
+from threading import TIMEOUT_MAX, Event, Thread
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple, Type
 
 if sys.version_info >= (3, 10):
     # WPS433: Found nested import
@@ -31,7 +33,12 @@ CommandState: Type["_CommandState"]
 ConditionCommandType: TypeAlias = Dict["Condition", Set[CallableCommandType]]
 ActionStack: TypeAlias = Dict["Action", ConditionCommandType]
 
-_INSTANCE: Optional["weakref.ref[Scheduler]"] = None
+# How long, in seconds, a subsystem's periodic method may take before a
+# warning is thrown about it slowing the scheduler down
+PERIODIC_BUDGET = 0.05
+
+# Shared stand-in for conditions without any bound commands
+_NO_COMMANDS: FrozenSet[CallableCommandType] = frozenset()
 
 
 class Scheduler(object):
@@ -47,7 +54,10 @@ class Scheduler(object):
 
     - All actions with bound `when` methods have their
         :meth:`~command_based_framework.actions.Action.poll` methods
-        called. For efficiency, unbound actions are ignored.
+        called. For efficiency, unbound actions are ignored. If
+        :attr:`~Scheduler.full_poll_interval` is set, only actions
+        passed to :meth:`~Scheduler.notify` are polled between full
+        polls.
     - If a `when` condition is met, the related command(s) are
         put onto the incoming stack. Any two commands which share
         requirements (subsystems) will result in the currently scheduled
@@ -86,14 +96,40 @@ class Scheduler(object):
 
     """  # noqa: E501
 
+    __slots__ = (
+        "__weakref__",
+        "_clock_speed",
+        "_all_stack",
+        "_actions_stack",
+        "_incoming_stack",
+        "_scheduled_stack",
+        "_ended_stack",
+        "_cancel_stack",
+        "_subsystem_stack",
+        "_dirty_actions",
+        "_full_poll_interval",
+        "_last_full_poll",
+        "_poll_cache",
+        "_periodic_workers",
+        "_periodic_pool",
+        "_periodic_pool_workers",
+        "_exec_thread",
+        "_exec_sentinel",
+        "_wake_event",
+        "_wake_pending",
+    )
+
+    # Weak reference to the global instance so deleting all references
+    # to the scheduler allows a new one to be created
     _instance: Optional["weakref.ReferenceType[Scheduler]"] = None
 
     # Clock speed is how fast the scheduler runs per second
     _clock_speed: float
 
     # All stack has references to all commands in any stack, regardless
-    # of status
-    _all_stack: Set[CallableCommandType]
+    # of status. References are weak so commands are released as soon as
+    # nothing else, including the other stacks, holds onto them
+    _all_stack: "weakref.WeakSet[CallableCommandType]"
 
     # Action stack has references to the mappings between commands and
     # actions
@@ -116,8 +152,35 @@ class Scheduler(object):
     _cancel_stack: Set[CommandType]
 
     # Subsystem stack has references to all subsystems that need to
-    # have their periodic methods called
-    _subsystem_stack: Set["Subsystem"]
+    # have their periodic methods called. Subsystems are kept in
+    # registration order so periodic methods run in a stable order
+    _subsystem_stack: Dict["Subsystem", None]
+
+    # Dirty actions have been notified of a change and are polled on the
+    # next frame, even between full polls. Appending to and popping from
+    # a deque are atomic, allowing any thread to notify without a lock
+    _dirty_actions: "deque[Action]"
+
+    # How long, in seconds, between polls of every bound action
+    _full_poll_interval: float
+
+    # When the last poll of every bound action occurred
+    _last_full_poll: float
+
+    # Poll cache has the last state key and poll result of each action
+    # providing a state key
+    _poll_cache: Dict["Action", Tuple[Hashable, bool]]
+
+    # How many threads run subsystem periodic methods, 0 runs them in
+    # the event loop's thread
+    _periodic_workers: int
+
+    # Thread pool running subsystem periodic methods, only created,
+    # resized, and shut down by the event loop's thread
+    _periodic_pool: Optional[ThreadPoolExecutor]
+
+    # How many threads the current thread pool was created with
+    _periodic_pool_workers: int
 
     # The thread managing the execution of the event loop
     _exec_thread: Thread
@@ -125,23 +188,40 @@ class Scheduler(object):
     # Responsible for killing the event loop if it is forked
     _exec_sentinel: Event
 
+    # Wakes the event loop early while it is waiting for the next frame
+    _wake_event: Event
+
+    # Indicates the event loop has already been woken for the next frame
+    _wake_pending: bool
+
     def __init__(self) -> None:
         """Creates a new :class:`Scheduler` instance."""
         # Check for existing instances
-        global _INSTANCE  # noqa: WPS420
-        if _INSTANCE and _INSTANCE():
+        # The reference is cleared as soon as the instance is collected
+        # Always read from and set on the base class so subclasses share
+        # the instance
+        if Scheduler._instance is not None:  # noqa: WPS437
             raise SchedulerExistsError(
                 "a scheduler already exists, a new one cannot be created",
             )
 
         # Set the global instance
-        _INSTANCE = weakref.ref(self)  # noqa: WPS122, WPS442
+        Scheduler._instance = weakref.ref(  # noqa: WPS437
+            self,
+            Scheduler._release_instance,  # noqa: WPS437
+        )
 
         # Continue with creation
         super().__init__()
-        self.clock_speed = 1 / 60
-        self._reset_all_stacks()
         self._exec_sentinel = Event()
+        self._wake_event = Event()
+        self._wake_pending = False
+        self.clock_speed = 1 / 60
+        self.full_poll_interval = 0
+        self._periodic_pool = None
+        self._periodic_pool_workers = 0
+        self.periodic_workers = 0
+        self._create_all_stacks()
 
         # Prevent circular import
         from command_based_framework.commands import CommandState as _CS  # noqa: N814
@@ -170,13 +250,71 @@ class Scheduler(object):
 
         self._clock_speed = clock_speed
 
+    @property
+    def full_poll_interval(self) -> float:
+        """How long, in seconds, between polls of every bound action.
+
+        Between full polls, only actions passed to :meth:`~.Scheduler.notify`
+        are polled. This value must always remain at or above 0 otherwise
+        a :exc:`ValueError` is raised.
+
+        Defaults to `0`, polling every bound action each frame.
+        """  # noqa: E501
+        return self._full_poll_interval
+
+    @full_poll_interval.setter
+    def full_poll_interval(self, full_poll_interval: float) -> None:
+        # Ensure the new interval is not negative
+        if full_poll_interval < 0:
+            raise ValueError("full poll interval must be at or above 0")
+
+        self._full_poll_interval = full_poll_interval
+
+        # Wake the event loop so an idle wait started with the old
+        # interval does not outlast the new one
+        self._wake()
+
+    @property
+    def periodic_workers(self) -> int:
+        """How many threads run subsystem periodic methods each frame.
+
+        Subsystems whose periodic methods block on I/O, i.e. reading
+        sensors, can be run concurrently so one slow subsystem does not
+        hold up the others. The scheduler still waits for every periodic
+        method to finish before the frame ends. Only enable this if the
+        periodic methods are safe to run at the same time. This value
+        must always remain at or above 0 otherwise a :exc:`ValueError`
+        is raised.
+
+        Defaults to `0`, running each periodic method in turn in the
+        event loop's thread.
+        """
+        return self._periodic_workers
+
+    @periodic_workers.setter
+    def periodic_workers(self, periodic_workers: int) -> None:
+        # Ensure the new number of workers is not negative
+        if periodic_workers < 0:
+            raise ValueError("periodic workers must be at or above 0")
+
+        # Only record the request, the event loop resizes its pool at
+        # the start of its next frame
+        self._periodic_workers = periodic_workers
+
     @classmethod
     def get_instance(cls) -> Optional["Scheduler"]:  # noqa: WPS615
         """Get the global scheduler instance."""
-        if _INSTANCE is not None:
-            return _INSTANCE()
+        instance = cls._instance
+        return None if instance is None else instance()
 
-        return None
+    @classmethod
+    def get_or_create(cls) -> "Scheduler":  # noqa: WPS615
+        """Get the global scheduler instance, creating it if needed.
+
+        Unlike creating a new scheduler directly, this never raises
+        :exc:`~command_based_framework.exceptions.SchedulerExistsError`.
+        """
+        return cls.get_instance() or cls()
 
     def bind_command(
         self,
@@ -185,21 +323,22 @@ class Scheduler(object):
         condition: "Condition",
     ) -> None:
         """Bind `command` to `action` to be scheduled on `condition`."""
-        current_condition_stack = self._actions_stack.setdefault(
-            action,
-            {condition: {command}},
-        )
-        for cond, cmdlist in current_condition_stack.items():
-            for cmd in cmdlist.copy():
-                if cmd == command:
-                    cmdlist.remove(cmd)
-                    break
-            current_condition_stack[cond] = cmdlist
+        current_condition_stack = self._actions_stack.setdefault(action, {})
+
+        # Remove any previous binding of this command on this action
+        for commands in current_condition_stack.values():
+            commands.discard(command)
         current_condition_stack.setdefault(condition, set()).add(command)
-        self._actions_stack[action] = current_condition_stack
-        self._all_stack.add(command)
 
-    def cancel(self, *commands: CommandType) -> None:  # noqa: C901, WPS213, WPS231
+        # Suppliers are never cancelled and may not support weak
+        # references, only track commands
+        if not callable(command):
+            self._all_stack.add(command)
+
+        # Poll the action promptly even if the event loop is idle
+        self.notify(action)
+
+    def cancel(self, *commands: CommandType) -> None:
         """Immediately cancel and interrupt any number of commands.
 
         If `commands` is not provided, interrupt all scheduled and
@@ -212,47 +351,12 @@ class Scheduler(object):
                 provided, interrupt all scheduled and initialized
                 commands.
         """
-        cancel_all = not commands
-        all_commands = set(commands) or self._all_stack
-        for command in all_commands.copy():
-            # Ignore commands which are callables
-            if callable(command):
-                continue
-
-            # Ignore commands that are idle
-            if command.state == CommandState.idle:
-                continue
-
-            command.state = CommandState.idle
-            try:
-                command.end(interrupted=True)
-            except Exception:
-                command.handle_exception(*sys.exc_info())
-                warnings.warn(
-                    (
-                        "{name} failed to interrupt, this command may have "
-                        "failed to properly quit."
-                    ).format(name=command.name),
-                    RuntimeWarning,
-                )
-
-                # Reset the interrupt flag
-                command.needs_interrupt  # noqa: WPS428
-
-            # Reset all requirements' current commands to none
-            for requirement in command.requirements:
-                requirement.current_command = None
-
-            # Remove the command from all stacks
-            with suppress(KeyError):
-                self._incoming_stack.remove(command)
-            with suppress(KeyError):
-                self._scheduled_stack.remove(command)
-            with suppress(KeyError):
-                self._ended_stack.remove(command)
-
-        if cancel_all:
-            self._reset_all_stacks()
+        # Each call shape gets its own loop rather than checking which
+        # one is being run for every command
+        if commands:
+            self._cancel_subset(commands)
+        else:
+            self._cancel_all()
 
     def execute(self, fork: bool = False) -> Optional[Future]:
         """Perpetually run the event loop.
@@ -270,6 +374,8 @@ class Scheduler(object):
         """  # noqa: DAR202
         # Reset the sentinel
         self._exec_sentinel.clear()
+        self._wake_event.clear()
+        self._wake_pending = False
 
         # Create a fork if necessary
         if fork:
@@ -280,6 +386,18 @@ class Scheduler(object):
 
         return self._execute()  # type: ignore
 
+    def notify(self, action: "Action") -> None:
+        """Mark `action` to be polled on the next frame.
+
+        Use this with :attr:`~.Scheduler.full_poll_interval` so actions
+        are only polled when something they depend on has changed.
+
+        Args:
+            action: The action to poll.
+        """
+        self._dirty_actions.append(action)
+        self._wake()
+
     def prestart_setup(self) -> None:
         """Run prestart checks and setup when :meth:`~.Scheduler.execute` is called."""  # noqa: E501
 
@@ -297,7 +415,11 @@ class Scheduler(object):
         Args:
             subsystem: The subsystem to register.
         """  # noqa: E501
-        self._subsystem_stack.add(subsystem)
+        self._subsystem_stack.setdefault(subsystem, None)
+
+        # Give the subsystem's default command a chance to be scheduled
+        # promptly even if the event loop is idle
+        self._wake()
 
     def run_once(self) -> None:
         """Run one complete loop of the scheduler's event loop.
@@ -321,6 +443,7 @@ class Scheduler(object):
         """
         # Signal the event loop to quit
         self._exec_sentinel.set()
+        self._wake_event.set()
 
         # AttributeError will be raised if exec has not been forked
         with suppress(AttributeError):
@@ -337,9 +460,15 @@ class Scheduler(object):
             self.prestart_setup()
 
             # Main loop
+            next_frame = time.monotonic()
             while not self._exec_sentinel.is_set():
+                # Notifications arriving from here on wake the loop for
+                # the frame after this one
+                self._wake_pending = False
                 self.run_once()
-                time.sleep(self.clock_speed)
+                next_frame = self._wait_for_next_frame(
+                    next_frame + self._clock_speed,
+                )
         except Exception as exc:
             # Ensure the parent thread receives the exception
             if fut:
@@ -349,6 +478,10 @@ class Scheduler(object):
             # Cancel all commands
             self.cancel()
 
+            # Stop the periodic threads along with the event loop, a
+            # new pool is created if it is started again
+            self._shutdown_periodic_pool()
+
             # Run postend user-defined code
             self.postend_teardown()
 
@@ -356,14 +489,55 @@ class Scheduler(object):
             if fut and not fut.done():
                 fut.set_result(None)
 
+    def _cancel_all(self) -> None:
+        # Snapshot the all stack since it is reset afterwards
+        idle = CommandState.idle
+        for command in tuple(self._all_stack):
+            # Ignore commands which are callables and commands that are
+            # idle
+            if callable(command) or command.state is idle:
+                continue
+
+            self._interrupt_command(command)
+
+        # No need to remove each command from the stacks, they are all
+        # reset at once
+        self._reset_all_stacks()
+
+    def _cancel_subset(self, commands: Iterable[CommandType]) -> None:
+        idle = CommandState.idle
+        for command in commands:
+            # Ignore commands which are callables and commands that are
+            # idle
+            if callable(command) or command.state is idle:
+                continue
+
+            self._interrupt_command(command)
+
+            # Remove the command from all stacks
+            self._incoming_stack.discard(command)
+            self._scheduled_stack.discard(command)
+            self._ended_stack.discard(command)
+
+    def _create_all_stacks(self) -> None:
+        self._all_stack = weakref.WeakSet()
+        self._actions_stack = {}
+        self._incoming_stack = set()
+        self._scheduled_stack = set()
+        self._ended_stack = set()
+        self._cancel_stack = set()
+        self._subsystem_stack = {}
+        self._dirty_actions = deque()
+        self._last_full_poll = float("-inf")
+        self._poll_cache = {}
+
     def _end_commands(self) -> None:
         # End commands normally
         for cmd in self._ended_stack:
             cmd.state = CommandState.idle
             with cmd:
                 cmd.end(interrupted=False)
-            with suppress(KeyError):
-                self._scheduled_stack.remove(cmd)
+            self._scheduled_stack.discard(cmd)
 
             # Reset all requirements' current commands to none
             for requirement in cmd.requirements:
@@ -377,14 +551,20 @@ class Scheduler(object):
             self.cancel(*self._cancel_stack)
 
     def _execute_commands(self) -> None:
-        for command in self._scheduled_stack.copy():
+        # Resolve everything that is the same for every command once
+        # rather than on each iteration
+        executing = CommandState.executing
+        scheduled_stack = self._scheduled_stack
+        ended_stack = self._ended_stack
+
+        for command in scheduled_stack.copy():
             # Check if the command is finished before executing it
             # Safer to do this check first
-            command.state = CommandState.executing
+            command.state = executing
             if command.is_finished():
                 with command:
                     command.end(interrupted=False)
-                self._scheduled_stack.remove(command)
+                scheduled_stack.remove(command)
 
                 # Reset all requirement's current commands to none
                 for requirement in command.requirements:
@@ -392,7 +572,7 @@ class Scheduler(object):
 
                 # Reset the interrupt flag
                 command.needs_interrupt  # noqa: WPS428
-                self._ended_stack.add(command)
+                ended_stack.add(command)
                 continue
 
             # Execute the command
@@ -404,11 +584,30 @@ class Scheduler(object):
                 self.cancel(command)
 
     def _execute_subsystems(self) -> None:
-        for subsystem in self._subsystem_stack:
-            with subsystem:
-                subsystem.periodic()
+        # Read the pool once so the whole frame uses the same one
+        pool = self._sync_periodic_pool()
+        subsystems = self._subsystem_stack
+        if pool is not None and len(subsystems) > 1:
+            futures = [
+                pool.submit(self._run_periodic, subsystem) for subsystem in subsystems
+            ]
+
+            # Wait for every periodic method before the frame continues,
+            # re-raising any error in registration order
+            for future in futures:
+                future.result()
+            return
+
+        for subsystem in subsystems:
+            self._run_periodic(subsystem)
+
+    def _init_commands(self) -> None:  # noqa: C901, WPS210, WPS231
+        # Combine the requirements of all scheduled commands so incoming
+        # commands only scan the scheduled stack if they conflict with it
+        scheduled_mask = 0
+        for scheduled in self._scheduled_stack:
+            scheduled_mask |= scheduled.requirements_mask
 
-    def _init_commands(self) -> None:  # noqa: C901, WPS231
         for command_callable in self._incoming_stack.copy():
             # If the "command" is a callable, run it and get the output
             command: CommandType = (
@@ -424,28 +623,31 @@ class Scheduler(object):
 
             # If the command shares requirements with other commands in
             # the stack, don't init
+            requirements_mask = command.requirements_mask
             skip = False
-            for cmd in self._incoming_stack.copy():
-                if cmd == command:
+            for cmd in self._incoming_stack:
+                if cmd is command:
                     continue
 
                 # Skip functions
-                if callable(command):
-                    continue  # type: ignore
+                if callable(cmd):
+                    continue
 
-                if cmd.requirements.intersection(command.requirements):  # type: ignore
-                    self._incoming_stack.remove(command)
+                if cmd.requirements_mask & requirements_mask:
                     skip = True
+                    break
             if skip:
+                self._incoming_stack.remove(command)
                 continue
 
             # Interrupt other commands that use this command's
             # requirements
-            for cmd in self._scheduled_stack.copy():
-                if cmd.requirements.intersection(command.requirements):
-                    # Cancel should automatically remove this cmd from
-                    # all stacks
-                    self.cancel(cmd)
+            if scheduled_mask & requirements_mask:
+                for cmd in self._scheduled_stack.copy():
+                    if cmd.requirements_mask & requirements_mask:
+                        # Cancel should automatically remove this cmd
+                        # from all stacks
+                        self.cancel(cmd)
 
             # Set all requirements current command to this incoming
             # command
@@ -462,96 +664,253 @@ class Scheduler(object):
                 # all stacks
                 self.cancel(command)
 
+    def _interrupt_command(self, command: CommandType) -> None:
+        command.state = CommandState.idle
+        try:
+            command.end(interrupted=True)
+        except Exception:
+            command.handle_exception(*sys.exc_info())
+            warnings.warn(
+                (
+                    "{name} failed to interrupt, this command may have "
+                    "failed to properly quit."
+                ).format(name=command.name),
+                RuntimeWarning,
+            )
+
+            # Reset the interrupt flag
+            command.needs_interrupt  # noqa: WPS428
+
+        # Reset all requirements' current commands to none
+        for requirement in command.requirements:
+            requirement.current_command = None
+
+    def _poll_action(self, action: "Action") -> bool:
+        # Reuse the last result while the action's inputs are unchanged
+        state_key = action.state_key()
+        if state_key is None:
+            return action.poll()
+
+        cached = self._poll_cache.get(action)
+        if cached is not None and cached[0] == state_key:
+            return cached[1]
+
+        state = action.poll()
+        self._poll_cache[action] = (state_key, state)
+        return state
+
     def _poll_actions(self) -> None:  # noqa: C901, WPS210, WPS231
         # Reimport Condition again since the top-level import will have
         # errored out and is only used for type-hints
         from command_based_framework.actions import Condition  # noqa: WPS442
 
-        for action, conditions_commands in self._actions_stack.items():
+        # Only drain what has been notified so far, later notifications
+        # are left for the next frame
+        # Drop cached results here rather than in notify() since a poll
+        # running when the action was notified may have cached a stale
+        # result after the notification
+        pending = len(self._dirty_actions)
+        dirty_actions: Set["Action"] = set()
+        for _ in range(pending):
+            dirty_action = self._dirty_actions.popleft()
+            self._poll_cache.pop(dirty_action, None)
+            dirty_actions.add(dirty_action)
+
+        # Poll every bound action when a full poll is due, otherwise only
+        # the actions notified since the last frame
+        now = time.monotonic()
+        actions: Iterable[Tuple["Action", ConditionCommandType]]
+        if now - self._last_full_poll >= self._full_poll_interval:
+            self._last_full_poll = now
+            actions = self._actions_stack.items()
+        else:
+            actions = [
+                (action, self._actions_stack[action])
+                for action in dirty_actions
+                if action in self._actions_stack
+            ]
+
+        for action, conditions_commands in actions:
             # Get the last and current state of the action
             # Update the last_state immediately since we are checking
             # the current state and the state may change
             last_state = action.last_state
-            current_state = action.poll()
+            current_state = self._poll_action(action)
             action.last_state = current_state
-            action_state = (last_state, current_state)
 
             # Handle each state type
-            if action_state == (False, True):
+            if current_state and not last_state:
                 # Cancel when activated
-                commands = conditions_commands.setdefault(
+                commands = conditions_commands.get(
                     Condition.cancel_when_activated,
-                    set(),
+                    _NO_COMMANDS,
                 )
                 self._cancel_stack.update(commands)  # type: ignore
 
                 # When activated
-                commands = conditions_commands.setdefault(
+                commands = conditions_commands.get(
                     Condition.when_activated,
-                    set(),
+                    _NO_COMMANDS,
                 )
                 self._incoming_stack.update(commands)
 
                 # Toggle when activated
-                commands = conditions_commands.setdefault(
+                commands = conditions_commands.get(
                     Condition.toggle_when_activated,
-                    set(),
+                    _NO_COMMANDS,
                 )
                 for command in commands:
                     if command in self._scheduled_stack:
                         self._ended_stack.add(command)  # type: ignore
                     else:
                         self._incoming_stack.add(command)
-            elif action_state == (True, True):
+            elif current_state:
                 # When held
-                commands = conditions_commands.setdefault(Condition.when_held, set())
+                commands = conditions_commands.get(Condition.when_held, _NO_COMMANDS)
                 self._incoming_stack.update(commands)
-            elif action_state == (True, False):
+            elif last_state:
                 # When deactivated
-                commands = conditions_commands.setdefault(
+                commands = conditions_commands.get(
                     Condition.when_deactivated,
-                    set(),
+                    _NO_COMMANDS,
                 )
                 self._incoming_stack.update(commands)
 
                 # When held
                 # Need to be able to deactivate when held, which occurs
                 # at the same time as when deactivated
-                commands = conditions_commands.setdefault(Condition.when_held, set())
+                commands = conditions_commands.get(Condition.when_held, _NO_COMMANDS)
                 self._ended_stack.update(commands)  # type: ignore
 
+    @classmethod
+    def _release_instance(cls, reference: "weakref.ReferenceType[Scheduler]") -> None:
+        # Only forget the global instance if it has not been replaced
+        # Always bound to the base class, where the instance is kept
+        if cls._instance is reference:
+            cls._instance = None
+
     def _reset_all_stacks(self) -> None:
-        self._all_stack = set()
-        self._actions_stack = {}
-        self._incoming_stack = set()
-        self._scheduled_stack = set()
-        self._ended_stack = set()
-        self._cancel_stack = set()
-        self._subsystem_stack = set()
+        # Clear the stacks in place rather than reallocating them
+        self._all_stack.clear()
+        self._actions_stack.clear()
+        self._incoming_stack.clear()
+        self._scheduled_stack.clear()
+        self._ended_stack.clear()
+        self._cancel_stack.clear()
+        self._subsystem_stack.clear()
+        self._dirty_actions.clear()
+        self._last_full_poll = float("-inf")
+        self._poll_cache.clear()
+
+    def _run_periodic(self, subsystem: "Subsystem") -> None:
+        start = time.monotonic()
+        with subsystem:
+            subsystem.periodic()
+
+        # Surface subsystems which block the event loop
+        if time.monotonic() - start > PERIODIC_BUDGET:
+            warnings.warn(
+                (
+                    "{name} took longer than {budget:g}s to run its periodic "
+                    "method, this may slow the scheduler down."
+                ).format(name=subsystem.name, budget=PERIODIC_BUDGET),
+                RuntimeWarning,
+            )
 
     def _schedule_default_commands(self) -> None:  # noqa: WPS231
+        # Gather every requirement in use by incoming and scheduled
+        # commands in a single pass instead of rescanning both stacks
+        # for each subsystem
+        required: Set["Subsystem"] = set()
+        for command in itertools.chain(self._incoming_stack, self._scheduled_stack):
+            # Ignore commands which are callables
+            if callable(command):
+                continue
+
+            required.update(command.requirements)
+
         for subsystem in self._subsystem_stack:
-            if subsystem.default_command and not subsystem.current_command:
-                for command in self._incoming_stack.union(self._scheduled_stack):
-                    # Ignore commands which are callables
-                    if callable(command):
-                        continue
+            default_command = subsystem.default_command
+            if not default_command or subsystem.current_command:
+                continue
+
+            if subsystem not in required:
+                self._incoming_stack.add(default_command)
+                required.update(default_command.requirements)
+
+    def _shutdown_periodic_pool(self) -> None:
+        pool = self._periodic_pool
+        self._periodic_pool = None
+        self._periodic_pool_workers = 0
+        if pool is not None:
+            pool.shutdown()
+
+    def _sync_periodic_pool(self) -> Optional[ThreadPoolExecutor]:
+        # Rebuild the pool if the requested number of workers changed
+        workers = self._periodic_workers
+        if workers != self._periodic_pool_workers:
+            self._shutdown_periodic_pool()
+            if workers:
+                self._periodic_pool = ThreadPoolExecutor(workers)
+                self._periodic_pool_workers = workers
 
-                    if subsystem in command.requirements:
-                        break
-                else:
-                    self._incoming_stack.add(subsystem.default_command)
+        return self._periodic_pool
 
     def _update_stack(self) -> None:
         # Remove interrupted and ended commands
-        self._scheduled_stack.difference_update(self._ended_stack)
-        self._scheduled_stack.difference_update(self._cancel_stack)
+        self._scheduled_stack.difference_update(
+            self._ended_stack,
+            self._cancel_stack,
+        )
 
         # Move incoming commands to scheduled stack
+        # Commands only enter the scheduled stack through the incoming
+        # stack, so only those need to be tracked in the all stack
         self._scheduled_stack.update(self._incoming_stack)  # type: ignore
-        self._all_stack.update(self._scheduled_stack)
+        self._all_stack.update(self._incoming_stack)
 
         # Reset incoming, ended, and interrupted stacks
         self._incoming_stack.clear()
         self._ended_stack.clear()
         self._cancel_stack.clear()
+
+    def _wake(self) -> None:
+        # Coalesce all wake ups until the next frame into a single wake
+        # up of the event loop
+        if not self._wake_pending:
+            self._wake_pending = True
+            self._wake_event.set()
+
+    def _wait_for_next_frame(self, deadline: float) -> float:
+        # While idle, nothing can be scheduled until the next full poll
+        # unless the scheduler is woken first. Subsystems keep the loop
+        # busy since their periodic methods run every frame
+        wake_deadline = deadline
+        busy = (
+            self._dirty_actions
+            or self._incoming_stack
+            or self._scheduled_stack
+            or self._subsystem_stack
+        )
+        if not busy:
+            wake_deadline = self._last_full_poll + self._full_poll_interval
+
+        # Sleep only for what remains of the frame so time spent running
+        # the frame does not cause the loop to drift
+        # Notifications only cut idle waits short, frames never run
+        # faster than the clock speed
+        # Very long intervals, i.e. infinity to only poll when notified,
+        # are clamped to the longest wait the platform supports
+        if wake_deadline > deadline:
+            timeout = min(wake_deadline - time.monotonic(), TIMEOUT_MAX)
+            self._wake_event.wait(max(0, timeout))
+        self._wake_event.clear()
+
+        now = time.monotonic()
+        if now < deadline:
+            self._exec_sentinel.wait(deadline - now)
+            return deadline
+
+        # Start the next frame now if woken from idle or if running
+        # behind, rather than running extra frames to catch up
+        return now
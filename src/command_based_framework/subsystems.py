@@ -1,10 +1,19 @@
-from typing import Optional
+import itertools
+from contextlib import suppress
+from typing import Optional, Set
+
+# Annotations only
+with suppress(ImportError):
+    from command_based_framework.actions import Action  # pragma: no cover
 
 from command_based_framework._common import CommandType, ContextManagerMixin
 from command_based_framework.scheduler import Scheduler
 
+# Source of the unique bit each subsystem occupies in requirement masks
+_SUBSYSTEM_IDS = itertools.count()
+
 
-class Subsystem(ContextManagerMixin):
+class Subsystem(ContextManagerMixin):  # noqa: WPS214
     """Breaks out complex robot components into methods and attributes.
 
     Subsystems define how something is performed; i.e. reading a sensor.
@@ -12,9 +21,21 @@ class Subsystem(ContextManagerMixin):
     not using the same resources simultaneously.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_name",
+        "_mask",
+        "_current_command",
+        "_default_command",
+        "_subscribers",
+    )
+
     # The name of the subsystem
     _name: str
 
+    # The bit uniquely identifying this subsystem in requirement masks
+    _mask: int
+
     # The command that is currently using this subsystem
     _current_command: Optional[CommandType]
 
@@ -22,6 +43,10 @@ class Subsystem(ContextManagerMixin):
     # used
     _default_command: Optional[CommandType]
 
+    # Actions the scheduler is notified of whenever this subsystem
+    # changes
+    _subscribers: Set["Action"]
+
     def __init__(self, name: Optional[str] = None) -> None:
         """Creates a new `Subsystem` instance.
 
@@ -34,8 +59,10 @@ class Subsystem(ContextManagerMixin):
         """
         super().__init__()
         self._name = name or self.__class__.__name__
+        self._mask = 1 << next(_SUBSYSTEM_IDS)
         self._current_command = None
         self._default_command = None
+        self._subscribers = set()
 
         # Register this subsystem in the scheduler's stack
         Scheduler.get_instance().register_subsystem(self)  # type: ignore
@@ -82,6 +109,19 @@ class Subsystem(ContextManagerMixin):
             )
         self._default_command = command
 
+    @property
+    def mask(self) -> int:
+        """The bit uniquely identifying this subsystem.
+
+        This is a read-only property.
+
+        Commands combine the masks of their requirements so the
+        scheduler can detect shared requirements with a single bitwise
+        and. See
+        :attr:`~command_based_framework.commands.Command.requirements_mask`.
+        """  # noqa: E501
+        return self._mask
+
     @property
     def name(self) -> str:
         """The name of the subsystem.
@@ -93,9 +133,28 @@ class Subsystem(ContextManagerMixin):
         """
         return self._name
 
+    def on_change(self) -> None:
+        """Notify the scheduler that this subsystem's state has changed.
+
+        Every subscribed action is polled on the next frame, even if a
+        full poll is not yet due. See
+        :attr:`~command_based_framework.scheduler.Scheduler.full_poll_interval`.
+        """  # noqa: E501
+        scheduler = Scheduler.get_instance()
+        for action in self._subscribers:
+            scheduler.notify(action)  # type: ignore
+
     def periodic(self) -> None:
         """Periodically called when the subsystem is required by a scheduled :class:`~command_based_framework.commands.Command`.
 
         Override this behavior to always execute by calling
         :meth:`~command_based_framework.scheduler.Scheduler.register_subsystem`.
         """  # noqa: E501
+
+    def subscribe(self, action: "Action") -> None:
+        """Poll `action` whenever :meth:`~Subsystem.on_change` is called.
+
+        Args:
+            action: The action depending on this subsystem.
+        """
+        self._subscribers.add(action)
@@ -1,9 +1,32 @@
-"""Dummy conftest.py for command_based_framework.
+"""Shared fixtures for command_based_framework.
 
-If you don't know what this is for, just leave it empty.
 Read more about conftest.py under:
 - https://docs.pytest.org/en/stable/fixture.html
 - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+from typing import Iterator
+
+import pytest
+
+from command_based_framework.scheduler import Scheduler
+
+
+@pytest.fixture
+def scheduler() -> Iterator[Scheduler]:
+    """Provide the global scheduler with empty stacks.
+
+    The stacks are cleared in place and the settings restored to their
+    defaults once the test finishes so state does not leak between
+    tests.
+    """
+    scheduler = Scheduler.get_or_create()
+    scheduler._reset_all_stacks()
+    yield scheduler
+    scheduler._reset_all_stacks()
+    scheduler.clock_speed = 1 / 60
+    scheduler.full_poll_interval = 0
+    scheduler.periodic_workers = 0
+
+    # The setter only records the count, release the pool right away
+    scheduler._shutdown_periodic_pool()
@@ -2,10 +2,8 @@ from command_based_framework.actions import Action, Condition
 from command_based_framework.commands import Command
 from command_based_framework.scheduler import Scheduler
 
-def test_bind_all_condition_types() -> None:
+def test_bind_all_condition_types(scheduler: Scheduler) -> None:
     """Verify all condition types bind properly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -41,3 +39,17 @@ def test_bind_all_condition_types() -> None:
     assert scheduler._actions_stack[action][Condition.when_activated] == {command_when_activated}
     assert scheduler._actions_stack[action][Condition.when_deactivated] == {command_when_deactivated}
     assert scheduler._actions_stack[action][Condition.when_held] == {command_when_held}
+
+
+def test_notify(scheduler: Scheduler) -> None:
+    """Verify actions notify the scheduler."""
+
+    class MyAction(Action):
+
+        def poll(self) -> bool:
+            return True
+
+    action = MyAction()
+    action.notify()
+
+    assert action in scheduler._dirty_actions
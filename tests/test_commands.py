@@ -1,4 +1,9 @@
+import pytest
+
+from command_based_framework.actions import Action
 from command_based_framework.commands import Command
+from command_based_framework.scheduler import Scheduler
+from command_based_framework.subsystems import Subsystem
 
 
 def test_name() -> None:
@@ -42,3 +47,58 @@ def test_needs_interrupt() -> None:
 
     # Verify reading the property reset it
     assert not command.needs_interrupt
+
+
+def test_requirements_mask(scheduler: Scheduler) -> None:
+    """Verify the requirements mask tracks added requirements."""
+
+    class MyCommand(Command):
+        def is_finished(self) -> bool:
+            return False
+        def execute(self) -> None:
+            return None
+
+    class MySubsystem(Subsystem):
+        def periodic(self) -> None:
+            return None
+
+    subsystem1 = MySubsystem()
+    subsystem2 = MySubsystem()
+    command1 = MyCommand(None, subsystem1)
+    command2 = MyCommand(None, subsystem2)
+
+    # Verify each subsystem occupies its own bit
+    assert subsystem1.mask & subsystem2.mask == 0
+    assert command1.requirements_mask == subsystem1.mask
+    assert not command1.requirements_mask & command2.requirements_mask
+
+    command2.add_requirements(subsystem1)
+    assert command2.requirements_mask == subsystem1.mask | subsystem2.mask
+    assert command1.requirements_mask & command2.requirements_mask
+
+
+def test_slotted_subclass() -> None:
+    """Verify subclasses declaring slots do not create a dict."""
+
+    class MyCommand(Command):
+        __slots__ = ("counter",)
+
+        def is_finished(self) -> bool:
+            return False
+        def execute(self) -> None:
+            return None
+
+    command = MyCommand()
+    command.counter = 1
+
+    assert not hasattr(command, "__dict__")
+    assert command.counter == 1
+
+
+def test_cannot_combine_with_action() -> None:
+    """Verify commands and actions cannot share a subclass."""
+
+    # Both declare their own slots so their layouts conflict
+    with pytest.raises(TypeError):
+        class MyCommand(Command, Action):
+            pass
@@ -1,13 +1,16 @@
+import gc
+import itertools
 import math
-from threading import Thread
+from threading import Barrier, Event, Thread
 import time
+import weakref
 
 import mock
 import pytest
 
 from command_based_framework.actions import Action, Condition
 from command_based_framework.commands import Command, CommandState, ParallelCommandGroup, SequentialCommandGroup
-from command_based_framework.scheduler import Scheduler
+from command_based_framework.scheduler import PERIODIC_BUDGET, Scheduler
 from command_based_framework.subsystems import Subsystem
 
 
@@ -35,9 +38,27 @@ def test_tracking_scheduler_instances() -> None:
         Scheduler()
 
 
-def test_setting_clock_speed() -> None:
+def test_get_or_create_scheduler() -> None:
+    """Verify the global scheduler is reused or created as needed."""
+    s = Scheduler.get_or_create()
+    assert Scheduler.get_instance() is s
+
+    # Verify the existing scheduler is returned
+    assert Scheduler.get_or_create() is s
+
+    # Delete the reference and verify a new scheduler is created
+    reference = weakref.ref(s)
+    del s
+
+    # The old scheduler is gone, so any scheduler returned is a new one
+    assert reference() is None
+    t = Scheduler.get_or_create()
+    assert isinstance(t, Scheduler)
+    assert Scheduler.get_instance() is t
+
+
+def test_setting_clock_speed(scheduler: Scheduler) -> None:
     """Verify the clock speed is set properly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
 
     assert math.isclose(scheduler.clock_speed, 1 / 60)
 
@@ -55,10 +76,8 @@ def test_setting_clock_speed() -> None:
     assert math.isclose(scheduler.clock_speed, 1 / 50)
 
 
-def test_rebinding_same_command() -> None:
+def test_rebinding_same_command(scheduler: Scheduler) -> None:
     """Verify actions are bound to commands correctly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -95,10 +114,8 @@ def test_rebinding_same_command() -> None:
     assert scheduler._actions_stack[action][new_condition] == {command}
 
 
-def test_binding_multiple_commands_same_action() -> None:
+def test_binding_multiple_commands_same_action(scheduler: Scheduler) -> None:
     """Verify multiple commands bind to an action."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -131,10 +148,8 @@ def test_binding_multiple_commands_same_action() -> None:
     assert action in scheduler._actions_stack
     assert scheduler._actions_stack[action] == {condition: {command1, command2}}
 
-def test_rebinding_multiple_commands_same_action() -> None:
+def test_rebinding_multiple_commands_same_action(scheduler: Scheduler) -> None:
     """Verify rebinding multiple commands on the same action."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -177,10 +192,8 @@ def test_rebinding_multiple_commands_same_action() -> None:
     assert scheduler._actions_stack[action][new_condition] == {command1}
 
 
-def test_binding_multiple_actions() -> None:
+def test_binding_multiple_actions(scheduler: Scheduler) -> None:
     """Verify binding a command to multiple actions."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -213,10 +226,8 @@ def test_binding_multiple_actions() -> None:
     assert scheduler._actions_stack[action2] == {condition2: {command}}
 
 
-def test_cancel_command() -> None:
+def test_cancel_command(scheduler: Scheduler) -> None:
     """Verify commands are canceled."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -251,10 +262,8 @@ def test_cancel_command() -> None:
     assert command.canceled_counter == 1
 
 
-def test_command_raises_runtime_warning_in_cancel() -> None:
+def test_command_raises_runtime_warning_in_cancel(scheduler: Scheduler) -> None:
     """Verify commands raise RuntimeWarnings if they fail to cancel."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -292,10 +301,8 @@ def test_command_raises_runtime_warning_in_cancel() -> None:
         scheduler.cancel(command)
 
 
-def test_scheduler_event_loop() -> None:
+def test_scheduler_event_loop(scheduler: Scheduler) -> None:
     """Verify the event loop schedules everything correctly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -536,10 +543,8 @@ def test_scheduler_event_loop() -> None:
     assert subsystem.periodic_counter == 10
 
 
-def test_toggle_commands() -> None:
+def test_toggle_commands(scheduler: Scheduler) -> None:
     """Verify commands toggle."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -628,10 +633,8 @@ def test_toggle_commands() -> None:
     assert command.did_finish == 2
 
 
-def test_command_error_cancels() -> None:
+def test_command_error_cancels(scheduler: Scheduler) -> None:
     """Verify commands cancel if methods raise unhandable exceptions."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -685,10 +688,8 @@ def test_command_error_cancels() -> None:
     assert command2.interrupted
 
 
-def test_conflicting_incoming_commands() -> None:
+def test_conflicting_incoming_commands(scheduler: Scheduler) -> None:
     """Verify incoming commands with conflicting requirements."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -737,6 +738,7 @@ def test_conflicting_incoming_commands() -> None:
     command1 = MyCommand("Command1", subsystem1)
     command2 = MyCommand("Command2", subsystem1)
     command3 = MyCommand("Command3", subsystem2)
+    command4 = MyCommand("Command4", subsystem1)
 
     # Inject both commands into the incoming stack
     scheduler._incoming_stack.add(command1)
@@ -748,11 +750,17 @@ def test_conflicting_incoming_commands() -> None:
     assert command1.did_init != command2.did_init
     assert command3.did_init
 
+    # Verify only one command runs when more than two conflict
+    scheduler._reset_all_stacks()
+    command1.reset()
+    command2.reset()
+    scheduler._incoming_stack.update({command1, command2, command4})
+    scheduler.run_once()
+    assert command1.did_init + command2.did_init + command4.did_init == 1
+
 
-def test_scheduled_incoming_conflicting_commands() -> None:
+def test_scheduled_incoming_conflicting_commands(scheduler: Scheduler) -> None:
     """Verify scheduled commands are interrupted by incoming commands."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -821,10 +829,8 @@ def test_scheduled_incoming_conflicting_commands() -> None:
 @mock.patch.object(Command, "execute")
 @mock.patch.object(Command, "is_finished")
 @mock.patch.object(Command, "end")
-def test_subsystems_dont_default_incoming_commands(*_) -> None:
+def test_subsystems_dont_default_incoming_commands(end, is_finished, execute, initialize, scheduler: Scheduler) -> None:
     """Verify subsystems detect incoming commands and don't default."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -875,10 +881,8 @@ def test_subsystems_dont_default_incoming_commands(*_) -> None:
 @mock.patch.object(Command, "execute")
 @mock.patch.object(Command, "is_finished")
 @mock.patch.object(Command, "end")
-def test_forked_exec(*_) -> None:
+def test_forked_exec(end, is_finished, execute, initialize, scheduler: Scheduler) -> None:
     """Verify execute runs normally when forked."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -936,10 +940,8 @@ def test_forked_exec(*_) -> None:
 @mock.patch.object(Command, "execute")
 @mock.patch.object(Command, "is_finished")
 @mock.patch.object(Command, "end")
-def test_exec(*_) -> None:
+def test_exec(end, is_finished, execute, initialize, scheduler: Scheduler) -> None:
     """Verify execute runs when executed in the main thread."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -999,10 +1001,8 @@ def test_exec(*_) -> None:
 @mock.patch.object(Command, "execute")
 @mock.patch.object(Command, "is_finished")
 @mock.patch.object(Command, "end")
-def test_exec_cancels_on_error(*_) -> None:
+def test_exec_cancels_on_error(end, is_finished, execute, initialize, scheduler: Scheduler) -> None:
     """Verify the event loop cancels all commands when errors occur."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -1084,10 +1084,8 @@ def test_exec_cancels_on_error(*_) -> None:
     assert command2.did_cancel
 
 
-def test_sequential_command_group() -> None:
+def test_sequential_command_group(scheduler: Scheduler) -> None:
     """Verify sequential command group operates as expected."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -1220,10 +1218,8 @@ def test_sequential_command_group() -> None:
     assert command4.did_interrupt == 0
 
 
-def test_parallel_command_group() -> None:
+def test_parallel_command_group(scheduler: Scheduler) -> None:
     """Verify parallel command groups execute as expected."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -1386,10 +1382,8 @@ def test_parallel_command_group() -> None:
     assert command6.did_interrupt == 1
 
 
-def test_callable_command_type() -> None:
+def test_callable_command_type(scheduler: Scheduler) -> None:
     """Verify callables that return commands are executed correctly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
-    scheduler._reset_all_stacks()
 
     # Verify the stack is empty
     assert not scheduler._actions_stack
@@ -1478,3 +1472,557 @@ def test_callable_command_type() -> None:
     scheduler.run_once()
 
     assert command2.did_init == 1
+
+
+def test_notified_actions_polled_between_full_polls(scheduler: Scheduler) -> None:
+    """Verify only notified actions are polled between full polls."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    class MySubsystem(Subsystem):
+
+        def periodic(self) -> None:
+            pass
+
+    # Ensure setting below 0 raises value errors
+    with pytest.raises(ValueError):
+        scheduler.full_poll_interval = -1
+
+    action1 = MyAction()
+    action2 = MyAction()
+    subsystem = MySubsystem()
+    action1.when_activated(MyCommand())
+    action2.when_activated(MyCommand())
+    subsystem.subscribe(action2)
+
+    # Polling every frame is the default
+    scheduler.run_once()
+    assert action1.poll_counter == 1
+    assert action2.poll_counter == 1
+
+    # Nothing was notified, so nothing is polled until the next full
+    # poll
+    scheduler.full_poll_interval = 60
+    scheduler.run_once()
+    assert action1.poll_counter == 1
+    assert action2.poll_counter == 1
+
+    # Notify the scheduler directly
+    scheduler.notify(action1)
+    scheduler.run_once()
+    assert action1.poll_counter == 2
+    assert action2.poll_counter == 1
+
+    # Notify the scheduler through a subscribed subsystem
+    subsystem.on_change()
+    scheduler.run_once()
+    assert action1.poll_counter == 2
+    assert action2.poll_counter == 2
+
+
+def test_idle_event_loop_waits_for_notify(scheduler: Scheduler) -> None:
+    """Verify an idle event loop sleeps until an action is notified."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    action = MyAction()
+    action.when_activated(MyCommand())
+    scheduler.full_poll_interval = 60
+
+    fut = scheduler.execute(fork=True)
+
+    # Only the first frame polls since nothing is scheduled
+    time.sleep(0.5)
+    assert action.poll_counter == 1
+
+    # Notifying the action wakes the event loop
+    scheduler.notify(action)
+    time.sleep(0.5)
+    assert action.poll_counter == 2
+
+    # Lowering the full poll interval wakes the event loop
+    scheduler.full_poll_interval = 3600
+    time.sleep(0.1)
+    scheduler.full_poll_interval = 0
+    time.sleep(0.5)
+    assert action.poll_counter > 3
+
+    scheduler.shutdown()
+    while not fut.done():
+        time.sleep(0.1)
+
+    poll_counter = action.poll_counter
+    scheduler.full_poll_interval = 60
+
+    class MySubsystem(Subsystem):
+
+        periodic_counter = 0
+
+        def periodic(self) -> None:
+            self.periodic_counter += 1
+
+    # Verify registered subsystems keep the event loop running at its
+    # clock speed while no full poll is due
+    subsystem = MySubsystem()
+    fut = scheduler.execute(fork=True)
+    time.sleep(0.5)
+
+    scheduler.shutdown()
+    while not fut.done():
+        time.sleep(0.1)
+
+    assert subsystem.periodic_counter > 10
+    assert action.poll_counter == poll_counter
+
+
+def test_idle_event_loop_with_infinite_full_poll_interval(scheduler: Scheduler) -> None:
+    """Verify an infinite full poll interval only polls when notified."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    action = MyAction()
+    action.when_activated(MyCommand())
+    scheduler.full_poll_interval = math.inf
+
+    fut = scheduler.execute(fork=True)
+
+    # Only the first frame polls since nothing is scheduled
+    time.sleep(0.5)
+    assert action.poll_counter == 1
+
+    # Notifying the action wakes the event loop
+    scheduler.notify(action)
+    time.sleep(0.5)
+    assert action.poll_counter == 2
+
+    scheduler.shutdown()
+    while not fut.done():
+        time.sleep(0.1)
+
+    assert fut.exception() is None
+
+
+def test_poll_results_reused_while_state_key_unchanged(scheduler: Scheduler) -> None:
+    """Verify actions are only polled when their state key changes."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        key = 0
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+        def state_key(self) -> int:
+            return self.key
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    action = MyAction()
+    action.when_activated(MyCommand())
+
+    scheduler.run_once()
+    scheduler.run_once()
+    assert action.poll_counter == 1
+
+    # A new key results in a new poll
+    action.key = 1
+    scheduler.run_once()
+    scheduler.run_once()
+    assert action.poll_counter == 2
+
+    # Notifying the scheduler always results in a new poll
+    scheduler.notify(action)
+    scheduler.run_once()
+    assert action.poll_counter == 3
+
+
+def test_notify_during_poll_results_in_new_poll(scheduler: Scheduler) -> None:
+    """Verify notifying an action while it is being polled is not lost."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    polling = Event()
+    notified = Event()
+
+    class MyAction(Action):
+
+        value = False
+
+        def poll(self) -> bool:
+            value = self.value
+            polling.set()
+            notified.wait(1)
+            return value
+
+        def state_key(self) -> int:
+            return 0
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+        def end(self, interrupted: bool) -> None:
+            return None
+
+    action = MyAction()
+    action.when_activated(MyCommand())
+
+    # Change the input and notify the scheduler while the action is
+    # being polled in another thread
+    thread = Thread(target=scheduler.run_once)
+    thread.start()
+    polling.wait(1)
+    action.value = True
+    scheduler.notify(action)
+    notified.set()
+    thread.join()
+    assert not action.last_state
+
+    # Verify the stale result is not reused on the notified frame
+    scheduler.run_once()
+    assert action.last_state
+
+
+def test_action_polled_once_per_frame(scheduler: Scheduler) -> None:
+    """Verify actions bound to many commands are polled once per frame."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    action = MyAction()
+    action.when_activated(MyCommand())
+    action.when_activated(MyCommand())
+    action.when_deactivated(MyCommand())
+    action.when_held(MyCommand())
+
+    # Notifying an action does not poll it a second time
+    scheduler.notify(action)
+    scheduler.run_once()
+    assert action.poll_counter == 1
+
+
+def test_slow_subsystem_raises_runtime_warning(scheduler: Scheduler) -> None:
+    """Verify subsystems blocking the scheduler raise RuntimeWarnings."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MySubsystem(Subsystem):
+
+        def periodic(self) -> None:
+            time.sleep(PERIODIC_BUDGET * 2)
+
+    subsystem = MySubsystem()
+
+    with pytest.warns(RuntimeWarning):
+        scheduler.run_once()
+
+
+def test_notify_from_other_threads(scheduler: Scheduler) -> None:
+    """Verify notifications from other threads are not lost."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        poll_counter = 0
+
+        def poll(self) -> bool:
+            self.poll_counter += 1
+            return False
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+    actions = [MyAction() for _ in range(100)]
+    for action in actions:
+        action.when_activated(MyCommand())
+
+    # Skip the first full poll
+    scheduler.run_once()
+    scheduler.full_poll_interval = 60
+
+    def notify_all() -> None:
+        for action in actions:
+            scheduler.notify(action)
+
+    threads = [Thread(target=notify_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    scheduler.run_once()
+    assert all(action.poll_counter == 2 for action in actions)
+
+
+def test_subsystems_run_in_registration_order(scheduler: Scheduler) -> None:
+    """Verify subsystem periodic methods run in registration order."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    calls = []
+
+    class MySubsystem(Subsystem):
+
+        def periodic(self) -> None:
+            calls.append(self)
+
+    subsystems = [MySubsystem() for _ in range(10)]
+
+    # Verify registering a subsystem again does not reorder the stack
+    scheduler.register_subsystem(subsystems[0])
+
+    scheduler.run_once()
+    assert calls == subsystems
+
+    calls.clear()
+    scheduler.run_once()
+    assert calls == subsystems
+
+
+def test_ended_commands_are_released(scheduler: Scheduler) -> None:
+    """Verify the scheduler does not keep ended commands alive."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyCommand(Command):
+
+        def is_finished(self) -> bool:
+            return True
+
+        def execute(self) -> None:
+            return None
+
+        def end(self, interrupted: bool) -> None:
+            return None
+
+        def initialize(self) -> None:
+            return None
+
+    command = MyCommand()
+    reference = weakref.ref(command)
+
+    scheduler._incoming_stack.add(command)
+    scheduler.run_once()
+    scheduler.run_once()
+    assert command in scheduler._all_stack
+    assert not scheduler._scheduled_stack
+
+    # Verify dropping the last reference releases the command
+    del command
+    gc.collect()
+    assert reference() is None
+    assert not scheduler._all_stack
+
+
+def test_binding_slotted_supplier(scheduler: Scheduler) -> None:
+    """Verify suppliers without weak reference support can be bound."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MyAction(Action):
+
+        def poll(self) -> bool:
+            return True
+
+    class MyCommand(Command):
+
+        did_init = 0
+
+        def initialize(self) -> None:
+            self.did_init += 1
+
+        def execute(self) -> None:
+            return None
+
+        def end(self, interrupted: bool) -> None:
+            return None
+
+        def is_finished(self) -> bool:
+            return False
+
+    class MySupplier(object):
+        __slots__ = ("command",)
+
+        def __init__(self, command: Command) -> None:
+            self.command = command
+
+        def __call__(self) -> Command:
+            return self.command
+
+    command = MyCommand()
+    supplier = MySupplier(command)
+    action = MyAction()
+    action.when_activated(supplier)
+    assert scheduler._actions_stack[action] == {Condition.when_activated: {supplier}}
+
+    # Verify the supplied command is scheduled
+    scheduler.run_once()
+    assert command.did_init == 1
+    assert command in scheduler._scheduled_stack
+
+
+def test_periodic_workers(scheduler: Scheduler) -> None:
+    """Verify subsystem periodic methods can run concurrently."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    # Verify the number of workers cannot be negative
+    with pytest.raises(ValueError):
+        scheduler.periodic_workers = -1
+
+    barrier = Barrier(3, timeout=1)
+    calls = []
+
+    class MySubsystem(Subsystem):
+
+        def handle_exception(self, *_) -> bool:
+            calls.append(None)
+            return True
+
+        def periodic(self) -> None:
+            # Only passes if every periodic method runs at the same time
+            barrier.wait()
+            calls.append(self)
+
+    subsystems = {MySubsystem() for _ in range(3)}
+
+    scheduler.periodic_workers = 3
+    scheduler.run_once()
+
+    assert set(calls) == subsystems
+
+    # Verify the pool is released at the start of the next frame
+    scheduler.periodic_workers = 0
+    scheduler._subsystem_stack.clear()
+    scheduler.run_once()
+    assert scheduler._periodic_pool is None
+
+
+def test_changing_periodic_workers_while_running(scheduler: Scheduler) -> None:
+    """Verify the periodic workers can change while the event loop runs."""
+
+    # Verify the stack is empty
+    assert not scheduler._actions_stack
+
+    class MySubsystem(Subsystem):
+
+        periodic_counter = 0
+
+        def periodic(self) -> None:
+            self.periodic_counter += 1
+
+    subsystems = [MySubsystem() for _ in range(4)]
+
+    fut = scheduler.execute(fork=True)
+
+    # Resize and disable the pool repeatedly while frames are running
+    end = time.monotonic() + 0.5
+    for workers in itertools.cycle((0, 2, 4)):
+        if time.monotonic() > end:
+            break
+        scheduler.periodic_workers = workers
+        time.sleep(0.001)
+
+    scheduler.shutdown()
+    while not fut.done():
+        time.sleep(0.1)
+
+    # Verify the event loop survived and kept running periodic methods
+    assert fut.exception() is None
+    assert all(subsystem.periodic_counter > 10 for subsystem in subsystems)
+    assert scheduler._periodic_pool is None
@@ -1,12 +1,12 @@
 import pytest
 
+from command_based_framework.actions import Action
 from command_based_framework.commands import Command
 from command_based_framework.scheduler import Scheduler
 from command_based_framework.subsystems import Subsystem
 
-def test_name() -> None:
+def test_name(scheduler: Scheduler) -> None:
     """Verify the name of subsystems are set properly."""
-    scheduler = Scheduler.get_instance() or Scheduler()
 
     class MySubsystem(Subsystem):
         def is_finished(self) -> bool:
@@ -21,9 +21,8 @@ def test_name() -> None:
     assert subsystem2.name == "HelloWorld"
 
 
-def test_current_and_default_commands() -> None:
+def test_current_and_default_commands(scheduler: Scheduler) -> None:
     """Verify current and default commands get set"""
-    scheduler = Scheduler.get_instance() or Scheduler()
 
     class MyCommand(Command):
         def execute(self) -> None:
@@ -57,3 +56,32 @@ def test_current_and_default_commands() -> None:
     # it
     with pytest.raises(ValueError):
         subsystem.default_command = command_no_requirement
+
+
+def test_slotted_subclass(scheduler: Scheduler) -> None:
+    """Verify subclasses declaring slots do not create a dict."""
+
+    class MySubsystem(Subsystem):
+        __slots__ = ("counter",)
+
+        def periodic(self) -> None:
+            return None
+
+    subsystem = MySubsystem()
+    subsystem.counter = 1
+
+    assert not hasattr(subsystem, "__dict__")
+    assert subsystem.counter == 1
+
+
+def test_cannot_combine_with_action_or_command() -> None:
+    """Verify subsystems cannot share a subclass with actions or commands."""
+
+    # Each declares its own slots so their layouts conflict
+    with pytest.raises(TypeError):
+        class MyAction(Subsystem, Action):
+            pass
+
+    with pytest.raises(TypeError):
+        class MyCommand(Command, Subsystem):
+            pass